@@ -1,4 +1,5 @@
 from typing import Iterable, Callable, TypeVar
+from datetime import datetime, timezone
 
 
 T = TypeVar('T')
@@ -11,3 +12,12 @@ def partition(pred: Callable[[T], bool], iterable: Iterable[T]) -> tuple[list[T]
         else:
             falses.append(item)
     return trues, falses
+
+def format_date(date: datetime) -> str:
+    """Formats a date as expected by Overpass (``"%Y-%m-%dT%H:%M:%SZ"``).
+    Timezone-aware dates are converted to UTC, naive dates are assumed to
+    already be in UTC.
+    """
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date.isoformat(timespec="seconds") + "Z"
@@ -4,35 +4,45 @@ from .errors import UnexpectedCompilationError
 if TYPE_CHECKING:
     from .base import Statement
 
+# Default variable names, formatted once and shared by every build
+_NAME_POOL = tuple(f"set_{i}" for i in range(128))
+
+
 class VariableManager:
     def __init__(self):
-        self._var_names: dict['Statement', str] = {}
+        # Names are keyed by statement id, which avoids calling the
+        # Python-level Statement.__hash__ on every lookup. The named
+        # statements are kept alive so that their ids cannot be reused.
+        self._var_names: dict[int, str] = {}
+        self._statements: list['Statement'] = []
+        self._used_names: set[str] = set()
         self._next_id = 0
 
     def get_or_compile(self, stmt: 'Statement', name_format: str = "{}") -> str:
-        if stmt in self._var_names:
-            return name_format.format(self._var_names[stmt])
-        else:
-            return stmt._compile(self)
+        name = self._var_names.get(id(stmt))
+        if name is not None:
+            return name_format.format(name)
+        return stmt._compile(self)
 
     def add_statement(self, stmt: 'Statement') -> str:
-        if stmt in self._var_names:
+        if id(stmt) in self._var_names:
             raise UnexpectedCompilationError(f"Trying to name an already named statement.", stmt)
         
-        name = f"set_{self._next_id}"
-        if stmt.label is not None and stmt.label not in self._var_names.values():
+        next_id = self._next_id
+        name = _NAME_POOL[next_id] if next_id < len(_NAME_POOL) else f"set_{next_id}"
+        if stmt.label is not None and stmt.label not in self._used_names:
             name = stmt.label
-        self._var_names[stmt] = name
+        self._var_names[id(stmt)] = name
+        self._used_names.add(name)
+        self._statements.append(stmt)
         self._next_id += 1
         return name
     
     def is_named(self, stmt: 'Statement') -> bool:
-        return stmt in self._var_names
+        return id(stmt) in self._var_names
 
     def __getitem__(self, stmt: 'Statement') -> str:
-        return self._var_names[stmt]
+        return self._var_names[id(stmt)]
     
     def get(self, stmt: 'Statement', if_none=None):
-        if stmt in self._var_names:
-            return self._var_names[stmt]
-        return if_none
\ No newline at end of file
+        return self._var_names.get(id(stmt), if_none)
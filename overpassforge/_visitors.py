@@ -9,6 +9,10 @@ from .errors import CircularDependencyError
 from dataclasses import dataclass
 
 
+# Marks exhausted dependency iterators in traverse_statement
+_END = object()
+
+
 class Visitor:
     """
     Base visitor class.
@@ -20,23 +24,64 @@ class Visitor:
         pass
 
 
+class VisitorGroup(Visitor):
+    """
+    Applies several visitors in a single traversal. Each statement is
+    passed to the visitors in the order they were given.
+    """
+    def __init__(self, *visitors: Visitor) -> None:
+        super().__init__()
+        self.visitors = visitors
+    
+    def visit_statement_pre(self, statement: Statement):
+        for visitor in self.visitors:
+            statement._accept_pre(visitor)
+    
+    def visit_statement_post(self, statement: Statement):
+        for visitor in self.visitors:
+            statement._accept_post(visitor)
+
+
 class CycleDetector(Visitor):
     """
     A visitor to detected cycles in a statement's dependency,
     raises a `CircularDependencyError` exception if detected.
     """
+
+    # Statements not yet seen are white (absent from the colors)
+    _GRAY = 1   # Being visited, i.e. on the current DFS path
+    _BLACK = 2  # Fully visited
+
     def __init__(self) -> None:
         super().__init__()
-        self.visiting: dict[Statement, bool] = {}
+        self.colors: dict[int, int] = {}
     
     def visit_statement_pre(self, statement: Statement):
-        if statement not in self.visiting:
-            self.visiting[statement] = True
-        elif self.visiting[statement]:
+        color = self.colors.get(id(statement))
+        if color is None:
+            self.colors[id(statement)] = self._GRAY
+        elif color == self._GRAY:
             raise CircularDependencyError(statement)
     
     def visit_statement_post(self, statement: Statement):
-        self.visiting[statement] = False
+        self.colors[id(statement)] = self._BLACK
+
+
+class SharedFilterCollector(Visitor):
+    """
+    Collects the filters of a statement's graph which reference no other
+    statement, as a `copy.deepcopy` memo. The graph copied by `build`
+    can share them, as they are never modified during a build.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.memo: dict[int, Filter] = {}
+    
+    def visit_statement_pre(self, statement: Statement):
+        if isinstance(statement, Set):
+            for filt in statement._filters:
+                if not filt._dependencies:
+                    self.memo[id(filt)] = filt
 
 
 class CombinationOptimizer(Visitor):
@@ -46,17 +91,17 @@ class CombinationOptimizer(Visitor):
         if not isinstance(statement, Union):
             return
         
-        # Remove nested unions
+        # Remove nested unions, unless their result must be outputed
         new_sets = []
         for subset in statement.statements:
-            if isinstance(subset, Union):
+            if isinstance(subset, Union) and len(subset.out_options) == 0:
                 new_sets.extend(subset.statements)
             else:
                 new_sets.append(subset)
         statement.statements = new_sets
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     """
     Stores additional information on a specific dependency.
@@ -78,27 +123,49 @@ class DependencyRetriever(Visitor):
     """
     def __init__(self) -> None:
         super().__init__()
-        self.deps: dict[Statement, Dependency] = {}
+        # Keyed by statement id: the Dependency records keep the
+        # statements alive for as long as the ids are looked up
+        self.by_id: dict[int, Dependency] = {}
+        # Statements in post-order, so that later passes which only
+        # need post-visits can iterate it instead of traversing again
+        self.order: list[Statement] = []
+        self._deps: dict[Statement, Dependency] | None = None
+    
+    @property
+    def deps(self) -> dict[Statement, Dependency]:
+        """The collected dependencies, keyed by statement. Built on first
+        access and rebuilt only if statements were collected since.
+        """
+        # Statements are only ever added, so an unchanged size means
+        # that the mapping is still up to date
+        if self._deps is None or len(self._deps) != len(self.by_id):
+            self._deps = {dep.statement: dep for dep in self.by_id.values()}
+        return self._deps
     
     def visit_statement_pre(self, statement: Statement):
-        if statement not in self.deps:
-            self.deps[statement] = Dependency(statement)
+        by_id = self.by_id
+        dep = by_id.get(id(statement))
+        if dep is None:
+            by_id[id(statement)] = Dependency(statement)
         else:
-            self.deps[statement].ref_count += 1
+            dep.ref_count += 1
 
         # If we are compiling raw statement or an overlapping area or a
         # map to area, all of its dependencies must be stored in variables
         if statement.__class__ in (RawStatement, OverlappingAreas, AsAreas):
             for stmt in statement._dependencies:
-                if stmt not in self.deps:
-                    self.deps[stmt] = Dependency(stmt, 0, True)
+                if id(stmt) not in by_id:
+                    by_id[id(stmt)] = Dependency(stmt, 0, True)
             return
         # Dependencies used by filters must always from variables
         if isinstance(statement, Set):
             for filt in statement._filters:
                 for stmt in filt._dependencies:
-                    if stmt not in self.deps:
-                        self.deps[stmt] = Dependency(stmt, 0, True)
+                    if id(stmt) not in by_id:
+                        by_id[id(stmt)] = Dependency(stmt, 0, True)
+    
+    def visit_statement_post(self, statement: Statement):
+        self.order.append(statement)
 
 
 class DependencySimplifier(Visitor):
@@ -113,7 +180,7 @@ class DependencySimplifier(Visitor):
         node[tourism=yes][amenity=restaurant];
     ```
     """
-    def __init__(self, deps: dict[Statement, Dependency]) -> None:
+    def __init__(self, deps: dict[int, Dependency]) -> None:
         super().__init__()
         self.deps = deps
 
@@ -122,7 +189,7 @@ class DependencySimplifier(Visitor):
             return statement
         
         new_filters: list[Filter] = []
-        is_single = lambda stmt: self.deps[stmt].ref_count == 1
+        is_single = lambda stmt: self.deps[id(stmt)].ref_count == 1
 
         for filt in statement._filters:
             if not isinstance(filt, Intersect):
@@ -149,7 +216,7 @@ class Compiler(Visitor):
     Compiles a statement: builds a sequence of string that once
     concatenated represents the compiled statement's query string.
     """
-    def __init__(self, root: Statement, deps: dict[Statement, Dependency]) -> None:
+    def __init__(self, root: Statement, deps: dict[int, Dependency]) -> None:
         super().__init__()
 
         self.root = root
@@ -163,13 +230,13 @@ class Compiler(Visitor):
 
         if statement == self.root:
             self.sequence.append(statement._compile(self.variables))
-        elif not self.deps[statement].can_inline:
+        elif not self.deps[id(statement)].can_inline:
             self.variables.add_statement(statement)
             compiled = statement._compile(self.variables)
             self.sequence.append(compiled)
         
         if isinstance(statement, Set) and len(statement.out_options) > 0:
-            self.sequence.append(statement._output(self.variables))
+            self.sequence.extend(statement._output(self.variables))
 
 
 def traverse_statement(statement: Statement, visitor: Visitor):
@@ -180,18 +247,23 @@ def traverse_statement(statement: Statement, visitor: Visitor):
     multiple times but post-visited only once.
     """
 
-    visited = set[Statement]()
-
-    def traverse(statement: Statement):
-        statement._accept_pre(visitor)
-        if statement in visited:
-            return
-        visited.add(statement)
-        for dep in statement._dependencies:
-            traverse(dep)
-        statement._accept_post(visitor)
-    
-    traverse(statement)
+    # Iterative DFS: each stack entry holds a statement and the iterator
+    # over its remaining dependencies.
+    statement._accept_pre(visitor)
+    visited = {id(statement)}
+    stack = [(statement, iter(statement._dependencies))]
+    while stack:
+        current, deps = stack[-1]
+        dep = next(deps, _END)
+        if dep is _END:
+            stack.pop()
+            current._accept_post(visitor)
+            continue
+        dep._accept_pre(visitor)
+        if id(dep) in visited:
+            continue
+        visited.add(id(dep))
+        stack.append((dep, iter(dep._dependencies)))
 
     # def traverse(stmt: Statement):
     #     return traverse_statement(stmt, visitor, visited)
@@ -5,6 +5,7 @@ from .filters import (
     BoundingBox,
     Regex,
     Key,
+    TagEquals,
     Intersect,
     Newer,
     Changed,
@@ -16,6 +17,7 @@ from .filters import (
 )
 from ._variables import VariableManager as _VariableManager
 from datetime import datetime
+from copy import deepcopy as _deepcopy
 
 if TYPE_CHECKING:
     from ._visitors import Visitor as _Visitor
@@ -31,13 +33,19 @@ if TYPE_CHECKING:
 
 
 OUT_OPTIONS = ("ids", "skel", "body", "tags", "meta", "noids", "geom", "bb", "center", "asc", "qt", "count")
+_OUT_OPTIONS_SET = frozenset(OUT_OPTIONS)
 
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# Marks unset slots when copying statements
+_MISSING = object()
+
 
 class Statement:
     """Represents a generic Overpass QL statement."""
 
+    __slots__ = ("label",)
+
     def __init__(self, label: str | None = None) -> None:
         """
         Args:
@@ -47,6 +55,39 @@ class Statement:
         """
         self.label = label
     
+    # Slots declared by the class and all its bases, see __deepcopy__
+    _slot_names: tuple[str, ...] = ("label",)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if name.startswith("__") and not name.endswith("__"):
+                    name = f"_{klass.__name__.lstrip('_')}{name}"
+                names.append(name)
+        cls._slot_names = tuple(names)
+    
+    def __deepcopy__(self, memo: dict) -> Statement:
+        # build() deep-copies the whole graph: copying the slots directly
+        # is much faster than the generic copyreg path for slotted objects
+        cls = self.__class__
+        copied = cls.__new__(cls)
+        memo[id(self)] = copied
+        for name in cls._slot_names:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                setattr(copied, name, _deepcopy(value, memo))
+        state = getattr(self, "__dict__", None)
+        if state:
+            copied.__dict__.update(_deepcopy(state, memo))
+        return copied
+    
     def _accept_pre(self, visitor: _Visitor):
         """Calls the appropriate visitor method when this statement is
         visited before visiting it's dependencies.
@@ -89,11 +130,13 @@ class Statement:
 class Set(Statement):
     """Represents a set, i.e. a statement that always returns a set of elements."""
 
+    __slots__ = ("_filters", "out_options")
+
     def __init__(self, filters: Iterable[Filter] = [], label: str | None = None) -> None:
         super().__init__(label)
 
         self._filters = list(filters)
-        self.out_options: list[set[str]] = []
+        self.out_options: list[tuple[str, ...]] = []
     
     def out(self, *options: str | tuple[float, float, float, float]):
         """
@@ -107,38 +150,30 @@ class Set(Statement):
         Raises:
             ValueError: Invalid output options.
         """
-        extract = lambda item: item.strip().split(' ')
         valid_options: set[str] = set()
         for item in options:
             if isinstance(item, str):
-                opts = set(filter(lambda opt: len(opt) > 0, extract(item)))
-                invalid = opts - set(OUT_OPTIONS)
-                if len(invalid) > 0:
-                    raise ValueError(f"Invalid out options: {','.join(invalid)}")
-                valid_options.update(opts)
+                for opt in item.split():
+                    if opt not in _OUT_OPTIONS_SET:
+                        raise ValueError(f"Invalid out option: {opt}")
+                    valid_options.add(opt)
+            elif isinstance(item, tuple) and len(item) == 4:
+                valid_options.add(f"({','.join(map(str, item))})")
             else:
-                valid_options.add(str(item))
+                raise ValueError(f"Invalid out option: {item}")
         
-        self.out_options.append(valid_options)
+        self.out_options.append(tuple(sorted(valid_options)))
     
-    def _output(self, vars: _VariableManager) -> str:
-        outs = []
+    def _output(self, vars: _VariableManager) -> list[str]:
+        """Returns one compiled ``out`` statement per call to ``out``."""
         var = vars.get(self)
         base = f".{var} out" if var is not None else "out"
-        for opts in self.out_options:
-            out = base
-            if len(opts) > 0:
-                out += " " + " ".join(sorted(opts))
-            out += ";"
-            outs.append(out)
-        return "\n".join(outs)
+        return [f"{base} {' '.join(opts)};" if len(opts) > 0 else f"{base};"
+                for opts in self.out_options]
     
     @property
     def _dependencies(self) -> list[Statement]:
-        deps: list[Statement] = []
-        for filt in self._filters:
-            deps.extend(filt._dependencies)
-        return deps
+        return [stmt for filt in self._filters for stmt in filt._dependencies]
     
     def __sub__(self, other: Set) -> Difference:
         from .statements import Difference
@@ -171,8 +206,8 @@ class Set(Statement):
         filters: list[Filter] = []
         for key in keys:
             filters.append(Key(key))
-        for key, value in tags.items():
-            filters.append(Key(key) == value)
+        if len(tags) > 0:
+            filters.append(TagEquals(tags.items()))
         return self.filter(*filters)
     
     def within(self, area: tuple[float,float,float,float] | BoundingBox | Polygon | Area | Areas) -> Set:
@@ -6,7 +6,9 @@ from ._visitors import Compiler as _Compiler
 from ._visitors import DependencyRetriever as _DependencyRetriever
 from ._visitors import DependencySimplifier as _DependencySimplifier
 from ._visitors import CombinationOptimizer as _CombinationOptimizer
-from .base import DATE_FORMAT
+from ._visitors import VisitorGroup as _VisitorGroup
+from ._visitors import SharedFilterCollector as _SharedFilterCollector
+from ._utils import format_date as _format_date
 from .errors import InvalidQuerySettings
 from dataclasses import dataclass
 from typing import Literal
@@ -62,15 +64,15 @@ class Settings:
             add(f"bbox:{','.join(map(str, self.bbox))}")
         
         if self.date is not None:
-            add(f"date:\"{self.date.strftime(DATE_FORMAT)}\"")
+            add(f"date:\"{_format_date(self.date)}\"")
         
         if self.diff is not None:
             if len(self.diff) == 2:
                 a, b = self.diff
-                add(f"diff:\"{a.strftime(DATE_FORMAT)}\",\"{b.strftime(DATE_FORMAT)}\"")
+                add(f"diff:\"{_format_date(a)}\",\"{_format_date(b)}\"")
             else:
                 a, = self.diff
-                add(f"diff:\"{a.strftime(DATE_FORMAT)}\"")
+                add(f"diff:\"{_format_date(a)}\"")
         
         return "".join(seq) + ";"
 
@@ -93,14 +95,22 @@ def build(statement: Statement, settings: Settings | None = None) -> str:
         InvalidQuerySettings: Invalid query settings.
         UnexpectedCompilationError: Unexpected internal compilation error.
     """
-    statement = copy.deepcopy(statement)
-    _traverse(statement, _CycleDetector())
-    _traverse(statement, _CombinationOptimizer())
+    # Work on a copy, sharing the filters that the build does not modify
+    shared = _SharedFilterCollector()
+    _traverse(statement, shared)
+    statement = copy.deepcopy(statement, shared.memo)
+    # Unions are only flattened once all their dependencies were checked
+    # for cycles, so both can share the same traversal
+    _traverse(statement, _VisitorGroup(_CycleDetector(), _CombinationOptimizer()))
     dependencies = _DependencyRetriever()
     _traverse(statement, dependencies)
-    _traverse(statement, _DependencySimplifier(dependencies.deps))
+    # The simplifier only rewrites a statement's own filters in its
+    # post-visit, so the post-order of the previous pass can be reused
+    simplifier = _DependencySimplifier(dependencies.by_id)
+    for stmt in dependencies.order:
+        stmt._accept_post(simplifier)
 
-    compiler = _Compiler(statement, dependencies.deps)
+    compiler = _Compiler(statement, dependencies.by_id)
     _traverse(statement, compiler)
 
     core_query = "\n".join(compiler.sequence)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Iterable
 from datetime import datetime
+from itertools import chain as _chain
 from ._variables import VariableManager as _VariableManager
-from ._utils import partition
+from ._utils import format_date as _format_date
 from .errors import InvalidFilterAttributes
 
 if TYPE_CHECKING:
@@ -14,6 +15,9 @@ class Filter:
     """
     Represents a generic filter that can be applied on a query statement.
     """
+
+    __slots__ = ("_raw",)
+
     def __init__(self, raw: str | None = None) -> None:
         self._raw = raw or ""
 
@@ -35,10 +39,44 @@ class Filter:
         return f"<Filter \"{self._raw}\">"
 
 
+class _StaticFilter(Filter):
+    """Base class of the filters whose compiled string only depends on their
+    own attributes. Subclasses implement ``_render``, which is called in
+    ``__init__`` and whenever one of their attributes is set (see
+    `_rendered_attribute`).
+    """
+
+    __slots__ = ("_cached",)
+
+    def _render(self) -> str:
+        raise NotImplementedError()
+
+    def _compile(self, vars: _VariableManager) -> str:
+        return self._cached
+
+
+def _rendered_attribute(name: str, convert=None) -> property:
+    """Public attribute of a `_StaticFilter`, stored in the ``_<name>`` slot.
+    Setting it re-renders the cached string of the filter. The value is
+    passed through ``convert`` first, if given.
+    """
+    slot = f"_{name}"
+
+    def fget(self):
+        return getattr(self, slot)
+
+    def fset(self, value):
+        setattr(self, slot, value if convert is None else convert(value))
+        self._cached = self._render()
+
+    return property(fget, fset)
+
 
 class Regex:
     """Wrapper around a string to indicate it should be treated as a regex."""
 
+    __slots__ = ("pattern",)
+
     def __init__(self, pattern: str) -> None:
         self.pattern = pattern
     
@@ -48,9 +86,14 @@ class Regex:
     def __repr__(self) -> str:
         return f"<Regex \"{self.pattern}\">"
 
-class Tag(Filter):
+class Tag(_StaticFilter):
     """Represents a generic tag filter."""
 
+    __slots__ = ("_comparison", "_case_sensitive")
+
+    comparison = _rendered_attribute("comparison")
+    case_sensitive = _rendered_attribute("case_sensitive")
+
     def __init__(self, comparison: str, case_sensitive=True):
         """
         Args:
@@ -59,15 +102,17 @@ class Tag(Filter):
             case_sensitive: ignore case (e.g. if comparison is "name"="Foo"
                 then a tag "name"="fOO" is also valid)
         """
-        self.comparison = comparison
-        self.case_sensitive = case_sensitive
+        self._comparison = comparison
+        self._case_sensitive = case_sensitive
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        return f"[{self.__str__()}]"
+    def _render(self) -> str:
+        if self._case_sensitive:
+            return f"[{self._comparison}]"
+        return f"[{self._comparison},i]"
     
     def __str__(self) -> str:
-        ending = "" if self.case_sensitive else ",i"
-        return f"{self.comparison}{ending}"
+        return self._cached[1:-1]
     
     def __repr__(self) -> str:
         return f"<Tag {self.comparison}, case={self.case_sensitive}>"
@@ -90,37 +135,84 @@ class Key(Tag):
     <Tag ~"^addr:.*$"!~"^Foo$", case=True>
     """
 
+    __slots__ = ()
+
     def __init__(self, key: str | Regex, case_sensitive=True):
         """
         Args:
             key: The key string.
         """
         if isinstance(key, Regex):
-            super().__init__(f"~\"{key}\"", case_sensitive)
+            super().__init__(f"~\"{key.pattern}\"", case_sensitive)
         else:
             super().__init__(f"\"{key}\"",  case_sensitive)
     
     def __eq__(self, value: str | Regex) -> Tag:
-        case = self.case_sensitive
         if isinstance(value, Regex):
-            return Tag(f"{self.comparison}~\"{value}\"", case)
-        return Tag(f"{self.comparison}=\"{value}\"", case)
+            return Tag(f"{self._comparison}~\"{value.pattern}\"", self._case_sensitive)
+        return Tag(f"{self._comparison}=\"{value}\"", self._case_sensitive)
     
     def __ne__(self, value: str | Regex) -> Tag:
-        case = self.case_sensitive
         if isinstance(value, Regex):
-            return Tag(f"{self.comparison}!~\"{value}\"", case)
-        return Tag(f"{self.comparison}!=\"{value}\"", case)
+            return Tag(f"{self._comparison}!~\"{value.pattern}\"", self._case_sensitive)
+        return Tag(f"{self._comparison}!=\"{value}\"", self._case_sensitive)
     
     def __invert__(self) -> Tag:
-        return Tag(f"!{self.comparison}", self.case_sensitive)
+        return Tag(f"!{self._comparison}", self._case_sensitive)
+    
+    def __hash__(self) -> int:
+        return id(self)
 
 
-class BoundingBox(Filter):
+class TagEquals(_StaticFilter):
+    """Filters the elements having all the given tags, as a single filter.
+    Equivalent to a sequence of ``Key(key) == value`` filters, and used for
+    the keyword tags of statements.
+
+    Example:
+
+    >>> print(build(Nodes(amenity="cinema", name=Regex("^Foo"))))
+    node["amenity"="cinema"]["name"~"^Foo"];
+    """
+
+    __slots__ = ("_tags",)
+
+    tags = _rendered_attribute("tags", tuple)
+
+    def __init__(self, tags: Iterable[tuple[str, str | Regex]]) -> None:
+        """
+        Args:
+            tags: The (key, value) pairs of the tags. A value may be a regex.
+        """
+        super().__init__()
+        self._tags = tuple(tags)
+        self._cached = self._render()
+    
+    def _render(self) -> str:
+        parts: list[str] = []
+        for key, value in self._tags:
+            if isinstance(value, Regex):
+                parts.append(f"[\"{key}\"~\"{value.pattern}\"]")
+            else:
+                parts.append(f"[\"{key}\"=\"{value}\"]")
+        return "".join(parts)
+    
+    def __repr__(self) -> str:
+        return f"<TagEquals {self._cached}>"
+
+
+class BoundingBox(_StaticFilter):
     """
     Bounding box filter on a query statement.
     """
 
+    __slots__ = ("_south", "_west", "_north", "_east")
+
+    south = _rendered_attribute("south")
+    west = _rendered_attribute("west")
+    north = _rendered_attribute("north")
+    east = _rendered_attribute("east")
+
     def __init__(self, south: float, west: float, north: float, east: float) -> None:
         """
         Args:
@@ -131,21 +223,26 @@ class BoundingBox(Filter):
         """
         super().__init__()
 
-        self.south = south
-        self.west = west
-        self.north = north
-        self.east = east
+        self._south = south
+        self._west = west
+        self._north = north
+        self._east = east
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        return f"({self.south},{self.west},{self.north},{self.east})"
+    def _render(self) -> str:
+        return f"({self._south},{self._west},{self._north},{self._east})"
     
     def __repr__(self) -> str:
         return f"<BoundingBox ({self.south},{self.west},{self.north},{self.east})>"
 
 
-class Ids(Filter):
+class Ids(_StaticFilter):
     """Represents an id filter."""
 
+    __slots__ = ("_ids",)
+
+    ids = _rendered_attribute("ids", tuple)
+
     def __init__(self, *ids: int) -> None:
         """
         Args:
@@ -153,16 +250,17 @@ class Ids(Filter):
         """
         super().__init__()
         
-        self.ids = ids
+        self._ids = ids
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        match len(self.ids):
-            case 0:
-                return ""
-            case 1:
-                return f"({self.ids[0]})"
-            case _:
-                return f"(id:{','.join(map(str, self.ids))})"
+    def _render(self) -> str:
+        ids = self._ids
+        n = len(ids)
+        if n == 0:
+            return ""
+        elif n == 1:
+            return f"({ids[0]})"
+        return "".join(("(id:", ",".join(map(str, ids)), ")"))
     
     def __repr__(self) -> str:
         return f"<Ids ({self.ids})>"
@@ -171,6 +269,8 @@ class Ids(Filter):
 class Intersect(Filter):
     """Intersection with other statement results."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, *statements: Statement) -> None:
         """
         Args:
@@ -182,43 +282,49 @@ class Intersect(Filter):
     
     @property
     def _dependencies(self) -> list[Statement]:
-        return [*self.statements]
+        return self.statements
     
     def _compile(self, vars: _VariableManager) -> str:
         if len(self.statements) == 0:
             raise InvalidFilterAttributes("Empty intersection.")
-        names: list[str] = []
-        for stmt in self.statements:
-            names.append(vars[stmt])
-        return "." + ".".join(names)
+        return "." + ".".join([vars[stmt] for stmt in self.statements])
     
     def __repr__(self) -> str:
         return f"<Intersect {', '.join(map(str, self.statements))}>"
 
 
-class Newer(Filter):
+class Newer(_StaticFilter):
     """Filter by newer change dates."""
 
+    __slots__ = ("_date",)
+
+    date = _rendered_attribute("date")
+
     def __init__(self, date: datetime):
         """
         Args:
             date: The oldest when the element has been modified.
         """
-        self.date = date
+        self._date = date
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        from .base import DATE_FORMAT
-        return f"(newer:\"{self.date.strftime(DATE_FORMAT)}\")"
+    def _render(self) -> str:
+        return f"(newer:\"{_format_date(self._date)}\")"
     
     def __repr__(self) -> str:
         return f"<Newer {self.date}>"
 
-class Changed(Filter):
+class Changed(_StaticFilter):
     """Filter that selects elements that have been changed between two given
     dates. If only the lower date is given, the second is assumed to be the
     front date of the database.
     """
 
+    __slots__ = ("_lower", "_upper")
+
+    lower = _rendered_attribute("lower")
+    upper = _rendered_attribute("upper")
+
     def __init__(self, lower: datetime, upper: datetime | None = None):
         """
         Args:
@@ -226,21 +332,36 @@ class Changed(Filter):
             upper: Dates' range upper bound. If not given, it is assumed to be the
                 front date of the database.
         """
-        self.lower = lower
-        self.upper = upper
+        self._lower = lower
+        self._upper = upper
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        from .base import DATE_FORMAT
-        if self.upper is None:
-            return f"(changed:\"{self.lower.strftime(DATE_FORMAT)}\")"
-        return f"(changed:\"{self.lower.strftime(DATE_FORMAT)}\",\"{self.upper.strftime(DATE_FORMAT)}\")"
+    def _render(self) -> str:
+        if self._upper is None:
+            return f"(changed:\"{_format_date(self._lower)}\")"
+        return f"(changed:\"{_format_date(self._lower)}\",\"{_format_date(self._upper)}\")"
     
     def __repr__(self) -> str:
         return f"<Changed {self.lower} - {self.upper}>"
 
-class User(Filter):
+def _split_users(users: Iterable[int | str]) -> tuple[list[str], list[str]]:
+    """Separates user ids from user names, returning both as strings."""
+    ids: list[str] = []
+    names: list[str] = []
+    for user in users:
+        if isinstance(user, int):
+            ids.append(str(user))
+        else:
+            names.append(str(user))
+    return ids, names
+
+class User(_StaticFilter):
     """Filter the elements last edited by the specified users."""
 
+    __slots__ = ("_users",)
+
+    users = _rendered_attribute("users", tuple)
+
     def __init__(self, *users: int | str) -> None:
         """
         Args:
@@ -249,24 +370,26 @@ class User(Filter):
         Raises:
             ValueError: No user specified.
         """
-        self.users = users
-
-    def _compile(self, vars: _VariableManager) -> str:
-        ids, names = partition(lambda x: isinstance(x, int), self.users)
-        ids = list(map(str, ids))
-        names = list(map(lambda x: f"\"{x}\"", names))
-        
-        compiled = ""
+        if len(users) == 0:
+            raise ValueError("No user specified.")
+        self._users = users
+        self._cached = self._render()
+    
+    def _render(self) -> str:
+        ids, names = _split_users(self._users)
+        parts: list[str] = []
         if len(ids) > 0:
-            compiled += f"(uid:{','.join(ids)})"
+            parts.extend(("(uid:", ",".join(ids), ")"))
         if len(names) > 0:
-            compiled += f"(user:{','.join(names)})"
-        return compiled
+            parts.extend(("(user:\"", "\",\"".join(names), "\")"))
+        return "".join(parts)
 
 
 class Area(Filter):
     """Filters the elements which are within the given area."""
 
+    __slots__ = ("input_area",)
+
     def __init__(self, input_area: 'Areas') -> None:
         """
         Args:
@@ -284,6 +407,8 @@ class Area(Filter):
 class Pivot(Filter):
     """Filters the elements which are part of the outline of the given area."""
 
+    __slots__ = ("input_area",)
+
     def __init__(self, input_area: 'Areas') -> None:
         """
         Args:
@@ -304,6 +429,8 @@ class Around(Filter):
     input set.
     """
 
+    __slots__ = ("radius", "input_set", "lats", "lons")
+
     def __init__(
         self,
         radius: float,
@@ -337,17 +464,20 @@ class Around(Filter):
         if self.input_set is not None:
             return f"(around.{vars[self.input_set]}:{self.radius})"
         if self.lats is not None and self.lons is not None:
-            latlons = []
-            for lat, lon in zip(self.lats, self.lons):
-                latlons.append(str(lat))
-                latlons.append(str(lon))
-            return f"(around:{self.radius},{','.join(latlons)})"
+            latlons = ','.join(map(str, _chain.from_iterable(zip(self.lats, self.lons))))
+            return f"(around:{self.radius},{latlons})"
         
         raise InvalidFilterAttributes("Input set or coordinates not defined.")
 
-class Polygon(Filter):
+
+class Polygon(_StaticFilter):
     """Filters all elements that are inside the defined polygon."""
 
+    __slots__ = ("_lats", "_lons")
+
+    lats = _rendered_attribute("lats", tuple)
+    lons = _rendered_attribute("lons", tuple)
+
     def __init__(self, lats: Iterable[float], lons: Iterable[float]) -> None:
         """
         Args:
@@ -355,12 +485,10 @@ class Polygon(Filter):
             lons: Longitudes of the points describing the polygon.
         """
         super().__init__()
-        self.lats = lats
-        self.lons = lons
+        self._lats = tuple(lats)
+        self._lons = tuple(lons)
+        self._cached = self._render()
     
-    def _compile(self, vars: _VariableManager) -> str:
-        latlons = []
-        for lat, lon in zip(self.lats, self.lons):
-            latlons.append(str(lat))
-            latlons.append(str(lon))
-        return f"(poly:\"{' '.join(latlons)}\")"
\ No newline at end of file
+    def _render(self) -> str:
+        latlons = ' '.join(map(str, _chain.from_iterable(zip(self._lats, self._lons))))
+        return f"(poly:\"{latlons}\")"
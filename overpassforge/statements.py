@@ -6,12 +6,19 @@ from .filters import (
     Filter,
     BoundingBox,
     Ids,
-    Key,
+    TagEquals,
     Intersect,
     Around,
     Area,
 )
 from typing import Iterable
+from string import Formatter as _Formatter
+
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+# Format of a reference to a named set inside a block statement
+_SET_REF = ".{};"
 
 
 class RawStatement(Statement):
@@ -29,6 +36,8 @@ class RawStatement(Statement):
     node.set_1(50.6,7.0,50.8,7.3);
     """
 
+    __slots__ = ("_raw", "_dependency_dict", "_dependency_list", "_segments", "_hash_output")
+
     def __init__(self, raw: str = "", label: str | None = None, **dependencies: Statement) -> None:
         """
         Args:
@@ -40,45 +49,68 @@ class RawStatement(Statement):
                 Their keyword names must match the placeholders in the raw query string.
         
         Raises:
-            ValueError: Invalid unamed placholder "{}".
+            ValueError: Invalid unamed placholder "{}" or placeholder without
+                matching dependency.
         """
 
         super().__init__(label)
 
         self._raw = raw
         self._dependency_dict = dependencies
-        if "{}" in raw:
-            raise ValueError("All inserted dependencies must be named.")
+        self._dependency_list: list[Statement] = list(dependencies.values())
+        
+        # Parse the placeholders once: (literal, field, format spec, conversion)
+        self._segments = list(_Formatter().parse(raw))
+        self._hash_output = False
+        for _, field, spec, _ in self._segments:
+            if field is None:
+                continue
+            if field == "":
+                if spec != "out_var":
+                    raise ValueError("All inserted dependencies must be named.")
+                self._hash_output = True
+            elif field not in dependencies:
+                raise ValueError(f"No dependency given for placeholder \"{field}\".")
     
     def _compile(self, vars: _VariableManager) -> str:
         """Compiles the statement into its Overpass query string, without eventual
         outputs.
         """
         var_names: dict[str, str] = {}
+        is_named = vars.is_named
         for name, stmt in self._dependency_dict.items():
-            if not vars.is_named(stmt):
+            if not is_named(stmt):
                 raise UnexpectedCompilationError("All inserted sets must use variables.")
             var_names[name] = vars[stmt]
-        compiled = self._raw
-        if self._hash_output:
-            compiled = compiled.replace("{:out_var}", vars.get(self) or "_")
-        elif vars.is_named(self):
+        out_var = vars.get(self)
+        if not self._hash_output and out_var is not None:
             raise UnexpectedCompilationError("No output variable specified.")
-        return compiled.format(**var_names)
-    
-    @property
-    def _hash_output(self):
-        return "{:out_var}" in self._raw
+        
+        parts: list[str] = []
+        for literal, field, spec, conversion in self._segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            if field == "" and spec == "out_var":
+                parts.append(out_var or "_")
+                continue
+            value = var_names[field]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, spec) if spec else value)
+        return "".join(parts)
 
     @property
     def _dependencies(self) -> list[Statement]:
         """List of statements on which this statement depends on."""
-        return list(self._dependency_dict.values())
+        return self._dependency_list
 
 
 class Elements(Set):
     """Represents a query set, e.g. node, rel, way..."""
 
+    __slots__ = ()
+
     _type_specifier: str = "nwr"
     
     def __init__(self,
@@ -94,7 +126,7 @@ class Elements(Set):
         
         super().__init__(filters, label)
 
-        if isinstance(input_set, Statement):
+        if input_set is not None:
             self._filters.append(Intersect(input_set))
 
         if isinstance(ids, int):
@@ -113,16 +145,13 @@ class Elements(Set):
         elif around is not None:
             self._filters.append(Around(around[1], around[0]))
         
-        for key, value in tags.items():
-            self._filters.append(Key(key) == value)
+        if len(tags) > 0:
+            self._filters.append(TagEquals(tags.items()))
     
     def _compile(self, vars: _VariableManager) -> str:
-        comp_filter = lambda f: f._compile(vars)
-        res = self._type_specifier + "".join(map(comp_filter, self._filters))
         out_var = vars.get(self)
-        if out_var is not None:
-            return res + f"->.{out_var};"
-        return res + ";"
+        suffix = ";" if out_var is None else f"->.{out_var};"
+        return f"{self._type_specifier}{''.join([f._compile(vars) for f in self._filters])}{suffix}"
 
 
 class Nodes(Elements):
@@ -138,21 +167,29 @@ class Nodes(Elements):
     (.set_0; - node.set_0["amenity"="cinema"];);
     """
 
+    __slots__ = ()
+
     _type_specifier: str = "node"
 
 class Ways(Elements):
     """A way query."""
 
+    __slots__ = ()
+
     _type_specifier: str = "way"
 
 class Relations(Elements):
     """A relation query."""
 
+    __slots__ = ()
+
     _type_specifier: str = "rel"
 
 class Areas(Elements):
     """An area query."""
 
+    __slots__ = ()
+
     _type_specifier: str = "area"
 
     def elements(self, *filters: Filter) -> Elements:
@@ -178,6 +215,8 @@ class Combination(Set):
     must derive from (e.g. unions, differences...).
     """
 
+    __slots__ = ()
+
     def __init__(self, label: str | None = None) -> None:
         super().__init__(label=label)
 
@@ -198,6 +237,8 @@ class Union(Combination):
     (way(42); node(42));
     """
 
+    __slots__ = ("statements",)
+
     def __init__(self, *statements: Set, label: str | None = None) -> None:
         """
         Args:
@@ -208,16 +249,14 @@ class Union(Combination):
     
     @property
     def _dependencies(self) -> list[Statement]:
-        return [*self.statements]
+        return self.statements
     
     def _compile(self, vars: _VariableManager) -> str:
-        substmts = []
-        for stmt in self.statements:
-            substmts.append(vars.get_or_compile(stmt, ".{};"))
+        get_or_compile = vars.get_or_compile
+        substmts = [get_or_compile(stmt, _SET_REF) for stmt in self.statements]
         out_var = vars.get(self)
-        if out_var is None:
-            return f"({' '.join(substmts)});"
-        return f"({' '.join(substmts)})->.{out_var};"
+        suffix = ";" if out_var is None else f"->.{out_var};"
+        return f"({' '.join(substmts)}){suffix}"
 
 
 class Difference(Combination):
@@ -233,6 +272,8 @@ class Difference(Combination):
     (way(50.6,7.0,50.8,7.3); - way(42););
     """
 
+    __slots__ = ("a", "b")
+
     def __init__(self, a: Statement, b: Statement, label: str | None = None) -> None:
         """
         Args:
@@ -248,17 +289,17 @@ class Difference(Combination):
         return [self.a, self.b]
     
     def _compile(self, vars: _VariableManager) -> str:
-        a = vars.get_or_compile(self.a, ".{};")
-        b = vars.get_or_compile(self.b, ".{};")
+        get_or_compile = vars.get_or_compile
         out_var = vars.get(self)
-        if out_var is None:
-            return f"({a} - {b});"
-        return f"({a} - {b})->.{out_var};"
+        suffix = ";" if out_var is None else f"->.{out_var};"
+        return f"({get_or_compile(self.a, _SET_REF)} - {get_or_compile(self.b, _SET_REF)}){suffix}"
 
 
 class _Recurse(Set):
     """Base class for recurse statements (>, >>, <, <<)."""
 
+    __slots__ = ("input_set",)
+
     _symbol: str = ""
 
     def __init__(self, input_set: Statement, label: str | None = None) -> None:
@@ -272,7 +313,7 @@ class _Recurse(Set):
     def _compile(self, vars: _VariableManager) -> str:
         in_var = vars.get(self.input_set)
         out_var = vars.get(self)
-        match vars.is_named(self.input_set), out_var is not None:
+        match in_var is not None, out_var is not None:
             case False, False:
                 return f"{self._symbol};"
             case True, False:
@@ -292,6 +333,7 @@ class RecurseDown(_Recurse):
 
     (taken from the Overpass QL documentation)
     """
+    __slots__ = ()
     _symbol = ">"
 
 class RecurseDownRels(_Recurse):
@@ -302,6 +344,7 @@ class RecurseDownRels(_Recurse):
 
     (taken from the Overpass QL documentation)
     """
+    __slots__ = ()
     _symbol = ">>"
 
 class RecurseUp(_Recurse):
@@ -314,6 +357,7 @@ class RecurseUp(_Recurse):
 
     (taken from the Overpass QL documentation)
     """
+    __slots__ = ()
     _symbol = "<"
 
 class RecurseUpRels(_Recurse):
@@ -324,6 +368,7 @@ class RecurseUpRels(_Recurse):
 
     (taken from the Overpass QL documentation)
     """
+    __slots__ = ()
     _symbol = "<<"
 
 
@@ -336,6 +381,8 @@ class OverlappingAreas(Areas):
     (taken from the Overpass QL documentation)
     """
 
+    __slots__ = ("input_set", "lat", "lon")
+
     def __init__(self,
         lat: float | None = None,
         lon: float | None = None,
@@ -368,14 +415,15 @@ class OverlappingAreas(Areas):
             raise InvalidStatementAttributes("Input set or coordinates not defined.")
 
         out_var = vars.get(self)
-        if out_var is not None:
-            return f"{res} ->.{out_var};"
-        return f"{res};"
+        suffix = ";" if out_var is None else f" ->.{out_var};"
+        return f"{res}{suffix}"
 
 
 class AsAreas(Areas):
     """Represents the ``map_to_area`` statement."""
 
+    __slots__ = ("input_set",)
+
     def __init__(self, input_set: Statement, label: str | None = None):
         super().__init__(label=label)
         self.input_set = input_set
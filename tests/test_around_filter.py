@@ -27,4 +27,13 @@ def test_around_one_point():
 
 def test_around_many_points():
     around = Around(10.0, lats=[42.0, -21.0], lons=[43.0, 17.5, 31.0])
-    assert around._compile(VariableManager()) == f"(around:10.0,42.0,43.0,-21.0,17.5)"
\ No newline at end of file
+    assert around._compile(VariableManager()) == f"(around:10.0,42.0,43.0,-21.0,17.5)"
+
+def test_around_integer_coordinates():
+    around = Around(10, lats=[1], lons=[2])
+    assert around._compile(VariableManager()) == f"(around:10,1,2)"
+
+def test_around_coordinates_change():
+    around = Around(10, lats=[1], lons=[2])
+    around.lats = [3]
+    assert around._compile(VariableManager()) == f"(around:10,3,2)"
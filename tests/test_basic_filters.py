@@ -1,7 +1,10 @@
-from overpassforge.filters import Filter, BoundingBox, Newer, Changed, User, Area, Pivot, Polygon
+from overpassforge.filters import Filter, Key, BoundingBox, Newer, Changed, User, Area, Pivot, Polygon
 from overpassforge.statements import Areas
 from overpassforge._variables import VariableManager
 from datetime import datetime
+from enum import IntEnum
+import pytest
+import copy
 
 def test_raw_filter(no_vars):
     assert Filter("some filter")._compile(no_vars) == "some filter"
@@ -28,6 +31,16 @@ def test_user_id(no_vars):
 def test_user_ids_names(no_vars):
     assert User("Steve",1,2,"Paul",3)._compile(no_vars) == "(uid:1,2,3)(user:\"Steve\",\"Paul\")"
 
+def test_user_int_subclasses(no_vars):
+    class UserId(IntEnum):
+        STEVE = 5
+    assert User(True)._compile(no_vars) == "(uid:True)"
+    assert User(UserId.STEVE, "Paul")._compile(no_vars) == "(uid:5)(user:\"Paul\")"
+
+def test_user_none():
+    with pytest.raises(ValueError):
+        User()
+
 def test_area_filter():
     a = Areas()
     vars = VariableManager()
@@ -42,4 +55,41 @@ def test_pivot_filter():
 
 def test_polygon_filter(no_vars):
     p = Polygon([50.7,50.7,50.75], [7.1,7.2,7.15])
-    assert p._compile(no_vars) == "(poly:\"50.7 7.1 50.7 7.2 50.75 7.15\")"
\ No newline at end of file
+    assert p._compile(no_vars) == "(poly:\"50.7 7.1 50.7 7.2 50.75 7.15\")"
+
+def test_polygon_filter_from_generators(no_vars):
+    p = Polygon((lat for lat in [50.7,50.7,50.75]), (lon for lon in [7.1,7.2,7.15]))
+    assert p._compile(no_vars) == "(poly:\"50.7 7.1 50.7 7.2 50.75 7.15\")"
+    assert p._compile(no_vars) == "(poly:\"50.7 7.1 50.7 7.2 50.75 7.15\")"
+
+def test_polygon_filter_integer_coordinates(no_vars):
+    p = Polygon([0,1,1], [0,0,1])
+    assert p._compile(no_vars) == "(poly:\"0 0 1 0 1 1\")"
+
+def test_filters_follow_attribute_changes(no_vars):
+    bb = BoundingBox(1, 2, 3, 4)
+    bb.north = 9
+    assert bb._compile(no_vars) == "(1,2,9,4)"
+
+    user = User("Steve")
+    user.users = [1, "Paul"]
+    assert user._compile(no_vars) == "(uid:1)(user:\"Paul\")"
+
+    changed = Changed(datetime(2023, 1, 1))
+    changed.upper = datetime(2023, 1, 2)
+    assert changed._compile(no_vars) == "(changed:\"2023-01-01T00:00:00Z\",\"2023-01-02T00:00:00Z\")"
+
+    p = Polygon([0, 1], [0, 0])
+    p.lats = [5, 6]
+    assert p._compile(no_vars) == "(poly:\"5 0 6 0\")"
+
+def test_filters_copies_are_independent(no_vars):
+    bb = BoundingBox(1, 2, 3, 4)
+    copied = copy.deepcopy(bb)
+    copied.north = 9
+    assert bb._compile(no_vars) == "(1,2,3,4)"
+
+    tag = Key("a") == "b"
+    copied = copy.deepcopy(tag)
+    copied.case_sensitive = False
+    assert tag._compile(no_vars) == "[\"a\"=\"b\"]"
@@ -45,7 +45,7 @@ def test_with_one_out():
     a.out(" body geom", " meta  ", (10.0,20.0,30.0,40.0))
     assert build(a) == \
         "node(42);\n" \
-        "out (10.0, 20.0, 30.0, 40.0) body geom meta;"
+        "out (10.0,20.0,30.0,40.0) body geom meta;"
 
 def test_with_two_out():
     a = Nodes(ids=42)
@@ -124,6 +124,8 @@ def test_chained_outs():
 def test_invalid_out_options():
     with pytest.raises(ValueError):
         Nodes().out("not an option")
+    with pytest.raises(ValueError):
+        Nodes().out((10.0, 20.0, 30.0))
 
 
 def test_consecutive_builds():
@@ -252,4 +254,15 @@ def test_as_areas_with_filter():
     assert build(a) == \
         """rel["name"="Foo"]->.set_0;\n""" \
         """.set_0 map_to_area ->.set_1;\n""" \
-        """area.set_1["bar"="Baz"];"""
\ No newline at end of file
+        """area.set_1["bar"="Baz"];"""
+
+def test_nested_union_with_out():
+    a = Nodes(ids=1)
+    b = Nodes(ids=2)
+    u1 = a + b
+    u1.out()
+    u2 = u1 + Nodes(ids=3)
+    assert build(u2) == \
+        "(node(1); node(2);)->.set_0;\n" \
+        ".set_0 out;\n" \
+        "(.set_0; node(3););"
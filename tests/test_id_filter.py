@@ -7,4 +7,7 @@ def test_one_id(no_vars):
     assert Ids(42)._compile(no_vars) == "(42)"
 
 def test_many_ids(no_vars):
-    assert Ids(10, 11, 12, 13)._compile(no_vars) == "(id:10,11,12,13)"
\ No newline at end of file
+    assert Ids(10, 11, 12, 13)._compile(no_vars) == "(id:10,11,12,13)"
+
+def test_large_ids(no_vars):
+    assert Ids(2**63, 1)._compile(no_vars) == f"(id:{2**63},1)"
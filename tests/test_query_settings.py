@@ -1,7 +1,7 @@
 from overpassforge.builder import Settings
 from overpassforge.errors import InvalidQuerySettings
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 def test_basics():
     assert Settings("json", 10, 10000, (10.0,20.0,30.0,40.0))._compile() == \
@@ -39,4 +39,12 @@ def test_diff():
         """[out:json][timeout:25][diff:"2023-01-01T00:00:00Z"];"""
     
     assert Settings(diff=(datetime(2023, 1, 1), datetime(2023, 4, 1)))._compile() == \
-        """[out:json][timeout:25][diff:"2023-01-01T00:00:00Z","2023-04-01T00:00:00Z"];"""
\ No newline at end of file
+        """[out:json][timeout:25][diff:"2023-01-01T00:00:00Z","2023-04-01T00:00:00Z"];"""
+
+def test_date_converted_to_utc():
+    date = datetime(2023, 1, 1, 7, 30, 15, 123, tzinfo=timezone.utc)
+    assert Settings(date=date)._compile() == \
+        """[out:json][timeout:25][date:"2023-01-01T07:30:15Z"];"""
+    date = datetime(2023, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert Settings(date=date)._compile() == \
+        """[out:json][timeout:25][date:"2023-01-01T07:00:00Z"];"""
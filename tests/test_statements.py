@@ -3,6 +3,8 @@ from overpassforge._variables import VariableManager
 from overpassforge.filters import *
 from overpassforge.errors import UnexpectedCompilationError
 import pytest
+from overpassforge.builder import build
+import copy
 
 def test_elements_statement(no_vars):
     assert Elements()._compile(no_vars) == "nwr;"
@@ -56,6 +58,12 @@ def test_union_statement_variable():
 def test_invalid_raw_statement_placeholder():
     with pytest.raises(ValueError):
         RawStatement("node[name=Foo]->.{};")
+    with pytest.raises(ValueError):
+        RawStatement("node[name=Foo]->.{:>3};")
+
+def test_raw_statement_missing_dependency():
+    with pytest.raises(ValueError):
+        RawStatement("node.{missing_var};")
 
 def test_raw_statement_no_vars(no_vars):
     a = Nodes()
@@ -122,4 +130,37 @@ def test_filter_around(vars_with_nodes: tuple[VariableManager, Nodes, str]):
     nodes_around = Nodes(name="Foo")
     around_var = vars.add_statement(nodes_around)
     assert nodes.around(100.0, nodes_around)._compile(vars) == \
-        f"""node.{nodes_var}(around.{around_var}:100.0);"""
\ No newline at end of file
+        f"""node.{nodes_var}(around.{around_var}:100.0);"""
+
+def test_deepcopy_statements():
+    a = Nodes(name="Foo")
+    a.out()
+    u = Union(a, Nodes(input_set=a), label="u")
+    copied = copy.deepcopy(u)
+    assert copied is not u and copied.label == "u"
+    copied_a, copied_b = copied.statements
+    assert copied_a is not a and copied_a.out_options == a.out_options
+    assert copied_b._filters[0].statements[0] is copied_a
+
+def test_deepcopy_subclass_slots():
+    class Unset(Nodes):
+        __slots__ = ("foo",)
+    class Weak(Nodes):
+        __slots__ = ("__weakref__",)
+    class Named(Nodes):
+        __slots__ = "extra"
+    class Private(Nodes):
+        __slots__ = ("__secret",)
+        def __init__(self):
+            super().__init__()
+            self.__secret = "x"
+        def secret(self):
+            return self.__secret
+
+    assert not hasattr(copy.deepcopy(Unset()), "foo")
+    assert build(Unset()) == "node;"
+    assert build(Weak()) == "node;"
+    named = Named()
+    named.extra = 42
+    assert copy.deepcopy(named).extra == 42
+    assert copy.deepcopy(Private()).secret() == "x"
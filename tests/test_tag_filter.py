@@ -1,4 +1,4 @@
-from overpassforge.filters import Key, Regex
+from overpassforge.filters import Key, Regex, TagEquals
 
 def test_equal(no_vars):
     assert (Key("amenity") == "cinema")._compile(no_vars) == """["amenity"="cinema"]"""
@@ -24,4 +24,12 @@ def test_key_value_match(no_vars):
 def test_case_insensitive(no_vars):
     tag = Key("amenity") == "cinema"
     tag.case_sensitive = False
-    assert tag._compile(no_vars) == """["amenity"="cinema",i]"""
\ No newline at end of file
+    assert tag._compile(no_vars) == """["amenity"="cinema",i]"""
+
+def test_key_is_hashable():
+    key = Key("amenity")
+    assert {key: 1}[key] == 1
+
+def test_tag_equals(no_vars):
+    tags = TagEquals([("amenity", "cinema"), ("name", Regex("^Foo$"))])
+    assert tags._compile(no_vars) == """["amenity"="cinema"]["name"~"^Foo$"]"""
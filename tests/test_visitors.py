@@ -1,5 +1,6 @@
 from overpassforge.statements import Nodes, Union, Difference
 from overpassforge._visitors import CycleDetector, DependencyRetriever, traverse_statement
+from overpassforge._visitors import CombinationOptimizer, VisitorGroup
 from overpassforge.errors import CircularDependencyError
 import pytest
 
@@ -75,6 +76,13 @@ def test_reference_count():
     assert counter.deps[b].ref_count == 2
     assert counter.deps[c].ref_count == 1
     assert counter.deps[d].ref_count == 1
+    assert counter.order == [a, b, c, d]
+
+    # Later visits show up in deps after it was first accessed
+    e = Nodes()
+    traverse_statement(Union(a, e), counter)
+    assert counter.deps[a].ref_count == 3
+    assert counter.deps[e].ref_count == 1
 
 def test_complex_reference_count():
     a = Nodes()
@@ -102,4 +110,22 @@ def test_complex_reference_count():
     assert counter.deps[g].ref_count == 2
     assert counter.deps[u2].ref_count == 2
     assert counter.deps[u4].ref_count == 1
-    assert counter.deps[u5].ref_count == 1
\ No newline at end of file
+    assert counter.deps[u5].ref_count == 1
+
+def test_deep_graph():
+    u = Nodes()
+    for i in range(5000):
+        u = Union(u, Nodes(ids=i))
+    traverse_statement(u, CycleDetector())
+
+def test_visitor_group():
+    a = Nodes()
+    b = Nodes()
+    c = Nodes()
+    u = Union(Union(a, b), c)
+    traverse_statement(u, VisitorGroup(CycleDetector(), CombinationOptimizer()))
+    assert u.statements == [a, b, c]
+
+    u.statements.append(u)
+    with pytest.raises(CircularDependencyError):
+        traverse_statement(u, VisitorGroup(CycleDetector(), CombinationOptimizer()))